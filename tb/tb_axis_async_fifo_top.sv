@@ -0,0 +1,113 @@
+`timescale 1ns / 1ps
+/**
+ * @brief Simulation top-level for the axis_async_fifo cocotb testbench.
+ *
+ * Generates both AXI-Stream clocks in HDL so the simulator never has to call
+ * back into Python to toggle them. All other DUT ports are exposed as top-level
+ * signals with the same names, so the testbench accesses them as before.
+ *
+ * Read-side backpressure is produced by a free-running LFSR on m_axis_aclk
+ * instead of being driven from Python every cycle. Set backpressure_en once
+ * from the testbench; while it is low m_axis_tready is held high.
+ *
+ * Write-side idle cycles are inserted the same way: a second LFSR on
+ * s_axis_aclk stalls the source for roughly idle_prob/256 of the cycles by
+ * hiding s_axis_tvalid from the DUT and s_axis_tready from the driver, so the
+ * driver simply holds its beat until the stall clears.
+ *
+ * @param DATA_WIDTH Passed through to axis_async_fifo.
+ * @param ADDR_WIDTH Passed through to axis_async_fifo.
+ * @param FWFT_EN    Passed through to axis_async_fifo.
+ */
+
+module tb_axis_async_fifo_top #(
+    parameter int DATA_WIDTH = 32,
+    parameter int ADDR_WIDTH = 5,
+    parameter bit FWFT_EN    = 1
+  );
+
+  // -------------------------------------------------------------------------
+  // Clock Generation
+  // -------------------------------------------------------------------------
+  // Write Clock: 10ns (100 MHz), Read Clock: 13ns (~76 MHz)
+  logic s_axis_aclk;
+  logic m_axis_aclk;
+
+  initial s_axis_aclk = 1'b0;
+  initial m_axis_aclk = 1'b0;
+
+  always #5   s_axis_aclk = ~s_axis_aclk;
+  always #6.5 m_axis_aclk = ~m_axis_aclk;
+
+  // -------------------------------------------------------------------------
+  // DUT Signals (driven / monitored from cocotb)
+  // -------------------------------------------------------------------------
+  logic                       s_axis_aresetn;
+  logic [DATA_WIDTH-1:0]      s_axis_tdata;
+  logic                       s_axis_tlast;
+  logic                       s_axis_tvalid;
+  logic                       s_axis_tready;
+
+  logic                       m_axis_aresetn;
+  logic [DATA_WIDTH-1:0]      m_axis_tdata;
+  logic                       m_axis_tlast;
+  logic                       m_axis_tvalid;
+  logic                       m_axis_tready;
+
+  logic [(2**ADDR_WIDTH)-1:0] m_axis_data_count;
+  logic [(2**ADDR_WIDTH)-1:0] m_axis_pkt_count;
+
+  // -------------------------------------------------------------------------
+  // Random Backpressure (Read Domain)
+  // -------------------------------------------------------------------------
+  // 16-bit Fibonacci LFSR, x^16 + x^14 + x^13 + x^11 + 1
+  logic        backpressure_en = 1'b0;
+  logic [15:0] lfsr            = 16'hACE1;
+  logic        m_axis_tready_int;
+
+  always_ff @(posedge m_axis_aclk)
+    lfsr <= {lfsr[14:0], lfsr[15] ^ lfsr[13] ^ lfsr[12] ^ lfsr[10]};
+
+  assign m_axis_tready_int = lfsr[0];
+  assign m_axis_tready     = backpressure_en ? m_axis_tready_int : 1'b1;
+
+  // -------------------------------------------------------------------------
+  // Random Idle Insertion (Write Domain)
+  // -------------------------------------------------------------------------
+  logic [7:0]  idle_prob  = 8'd0;
+  logic [15:0] stall_lfsr = 16'h1D0B;
+  logic        s_stall;
+  logic        fifo_s_axis_tvalid;
+  logic        fifo_s_axis_tready;
+
+  always_ff @(posedge s_axis_aclk)
+    stall_lfsr <= {stall_lfsr[14:0], stall_lfsr[15] ^ stall_lfsr[13] ^ stall_lfsr[12] ^ stall_lfsr[10]};
+
+  assign s_stall            = (stall_lfsr[7:0] < idle_prob);
+  assign fifo_s_axis_tvalid = s_axis_tvalid && !s_stall;
+  assign s_axis_tready      = fifo_s_axis_tready && !s_stall;
+
+  axis_async_fifo #(
+                    .DATA_WIDTH(DATA_WIDTH),
+                    .ADDR_WIDTH(ADDR_WIDTH),
+                    .FWFT_EN(FWFT_EN)
+                  ) dut (
+                    .s_axis_aclk(s_axis_aclk),
+                    .s_axis_aresetn(s_axis_aresetn),
+                    .s_axis_tdata(s_axis_tdata),
+                    .s_axis_tlast(s_axis_tlast),
+                    .s_axis_tvalid(fifo_s_axis_tvalid),
+                    .s_axis_tready(fifo_s_axis_tready),
+
+                    .m_axis_aclk(m_axis_aclk),
+                    .m_axis_aresetn(m_axis_aresetn),
+                    .m_axis_tdata(m_axis_tdata),
+                    .m_axis_tlast(m_axis_tlast),
+                    .m_axis_tvalid(m_axis_tvalid),
+                    .m_axis_tready(m_axis_tready),
+
+                    .m_axis_data_count(m_axis_data_count),
+                    .m_axis_pkt_count(m_axis_pkt_count)
+                  );
+
+endmodule
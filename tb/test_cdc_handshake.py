@@ -1,14 +1,18 @@
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer, Combine
+from cocotb.triggers import RisingEdge, ReadOnly, Combine
 import random
 
-async def reset_dut(reset_n, clk):
-    reset_n.value = 0
-    await Timer(50, "ns")
-    await RisingEdge(clk)
-    reset_n.value = 1
-    await RisingEdge(clk)
+from util import reset_dut
+
+async def wait_until(clk, sig, cycles=20):
+    """Wait up to `cycles` edges of clk for sig to be high, sampled in ReadOnly"""
+    for _ in range(cycles):
+        await RisingEdge(clk)
+        await ReadOnly()
+        if sig.value:
+            return True
+    return False
 
 @cocotb.test()
 async def test_cdc_handshake_basic(dut):
@@ -29,9 +33,14 @@ async def test_cdc_handshake_basic(dut):
     
     await RisingEdge(dut.w_clk)
     
+    width = int(dut.WIDTH.value)
+    mask = (1 << width) - 1
+    
+    timeout = 20
+    
     # Perform several transfers
     for i in range(10):
-        test_data = random.randint(0, (2**int(dut.WIDTH.value)) - 1)
+        test_data = random.randint(0, mask)
         
         # Wait for ready
         while not dut.w_ready.value:
@@ -45,25 +54,18 @@ async def test_cdc_handshake_basic(dut):
         
         # Wait for r_valid in read domain
         # This could take several cycles
-        timeout = 20
-        received = False
-        for _ in range(timeout):
-            await RisingEdge(dut.r_clk)
-            if dut.r_valid.value:
-                assert dut.r_data.value == test_data, f"Data mismatch: sent {test_data}, got {dut.r_data.value}"
-                received = True
-                break
-        
+        received = await wait_until(dut.r_clk, dut.r_valid, timeout)
         assert received, f"Transfer timeout on iteration {i}"
+        r_data = dut.r_data.value.integer
+        assert r_data == test_data, f"Data mismatch: sent {test_data}, got {r_data}"
         
         # Wait for w_ready to go high again before next transfer
         # (This confirms the ack made it back)
-        for _ in range(timeout):
-            await RisingEdge(dut.w_clk)
-            if dut.w_ready.value:
-                break
-        else:
-            assert False, f"Ready timeout on iteration {i}"
+        ready = await wait_until(dut.w_clk, dut.w_ready, timeout)
+        assert ready, f"Ready timeout on iteration {i}"
+        
+        # Leave the read-only phase before driving the next transfer
+        await RisingEdge(dut.w_clk)
 
 @cocotb.test()
 async def test_cdc_handshake_clocks(dut):
@@ -78,8 +80,11 @@ async def test_cdc_handshake_clocks(dut):
         cocotb.start_soon(reset_dut(dut.r_reset_n, dut.r_clk))
     )
     
+    width = int(dut.WIDTH.value)
+    mask = (1 << width) - 1
+    
     for _ in range(5):
-        test_data = random.randint(0, (2**int(dut.WIDTH.value)) - 1)
+        test_data = random.randint(0, mask)
         dut.w_data.value = test_data
         dut.w_valid.value = 1
         await RisingEdge(dut.w_clk)
@@ -87,7 +92,7 @@ async def test_cdc_handshake_clocks(dut):
         
         while not dut.r_valid.value:
             await RisingEdge(dut.r_clk)
-        assert dut.r_data.value == test_data
+        assert dut.r_data.value.integer == test_data
         
         while not dut.w_ready.value:
             await RisingEdge(dut.w_clk)
@@ -1,8 +1,10 @@
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, Timer
+from cocotb.triggers import RisingEdge, ReadOnly
 import random
 
+from util import reset_dut
+
 @cocotb.test()
 async def test_cdc_sync_basic(dut):
     """Test basic synchronization with default stages"""
@@ -11,11 +13,8 @@ async def test_cdc_sync_basic(dut):
     cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
     
     # Reset
-    dut.reset_n.value = 0
     dut.d.value = 0
-    await Timer(50, units="ns")
-    dut.reset_n.value = 1
-    await RisingEdge(dut.clk)
+    await reset_dut(dut.reset_n, dut.clk)
     
     # Check initial value
     assert dut.q.value == 0, f"Initial value should be 0, got {dut.q.value}"
@@ -27,22 +26,23 @@ async def test_cdc_sync_basic(dut):
     dut.d.value = 1
     for i in range(stages):
         await RisingEdge(dut.clk)
+        await ReadOnly() # Let logic settle after the edge
         # Output shouldn't be high yet until the last stage
         if i < stages - 1:
             assert dut.q.value == 0, f"Output changed too early at cycle {i}"
     
     # Now it should be 1
-    await Timer(1, units="ns") # Small delay for logic propagation in sim if needed
     assert dut.q.value == 1, f"Output should be 1 after {stages} cycles"
     
-    # Test low pulse
+    # Test low pulse (leave the read-only phase before driving)
+    await RisingEdge(dut.clk)
     dut.d.value = 0
     for i in range(stages):
         await RisingEdge(dut.clk)
+        await ReadOnly()
         if i < stages - 1:
             assert dut.q.value == 1, f"Output changed too early at cycle {i}"
     
-    await Timer(1, units="ns")
     assert dut.q.value == 0, f"Output should be 0 after {stages} cycles"
 
 @cocotb.test()
@@ -51,11 +51,8 @@ async def test_cdc_sync_random(dut):
     
     cocotb.start_soon(Clock(dut.clk, 10, units="ns").start())
     
-    dut.reset_n.value = 0
     dut.d.value = 0
-    await Timer(50, units="ns")
-    dut.reset_n.value = 1
-    await RisingEdge(dut.clk)
+    await reset_dut(dut.reset_n, dut.clk)
     
     stages = int(dut.STAGES.value)
     
@@ -63,11 +60,12 @@ async def test_cdc_sync_random(dut):
     history = [0] * stages
     
     for _ in range(100):
+        # Drive right after the edge so it is sampled on the next one
+        await RisingEdge(dut.clk)
         new_val = random.randint(0, 1)
         dut.d.value = new_val
         
-        await RisingEdge(dut.clk)
-        await Timer(1, units="ns")
+        await ReadOnly()
         
         expected = history.pop(0)
         assert dut.q.value == expected, f"Mismatch: expected {expected}, got {dut.q.value}"
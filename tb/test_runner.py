@@ -15,12 +15,24 @@ def test_fifo(fwft_en):
         "FWFT_EN": str(fwft_en)
     }
 
+    # HDL delays for clock generation, one eval thread per clock domain
+    extra_args = ["--timing", "--threads", "2", "--threads-dpi", "none"]
+
+    # Waveform dumping is opt-in (WAVES=1), otherwise build for speed
+    if os.environ.get("WAVES"):
+        extra_args += ["--trace", "--trace-structs"]
+    else:
+        extra_args += ["-O3", "--x-assign", "fast", "--x-initial", "fast"]
+
     run(
-        verilog_sources=[os.path.join(rtl_dir, "axis_async_fifo.sv")],
-        toplevel="axis_async_fifo",
+        verilog_sources=[
+            os.path.join(rtl_dir, "axis_async_fifo.sv"),
+            os.path.join(test_dir, "tb_axis_async_fifo_top.sv"),
+        ],
+        toplevel="tb_axis_async_fifo_top", # Generates clocks in HDL
         module="test_axis_async_fifo",
         simulator="verilator",
         parameters=params,
-        extra_args=["--trace", "--trace-structs"], # Enable tracing
+        extra_args=extra_args,
         sim_build=f"sim_build_fwft_{fwft_en}",
     )
@@ -0,0 +1,20 @@
+from cocotb.triggers import RisingEdge
+
+# RisingEdge trigger per clock handle, shared across resets and tests
+_rising_edges = {}
+
+def rising_edge(clk):
+    """Return the cached RisingEdge trigger for clk"""
+    edge = _rising_edges.get(clk)
+    if edge is None:
+        edge = _rising_edges[clk] = RisingEdge(clk)
+    return edge
+
+async def reset_dut(reset_n, clk, cycles=5):
+    """Hold active-low reset_n for `cycles` edges of clk, then release it"""
+    edge = rising_edge(clk)
+    reset_n.value = 0
+    for _ in range(cycles):
+        await edge
+    reset_n.value = 1
+    await edge